@@ -0,0 +1,72 @@
+from typing import Dict, List
+
+
+QUOTES = ("'", '"')
+
+
+def parse(text: str) -> Dict[str, str]:
+    """Parse dotenv text in a single pass over its lines.
+
+    Supports the minimal grammar used by `.env.example` and by `DotEnvFile.save`:
+
+    - blank lines and lines starting with `#` are skipped
+    - each entry is `KEY=VALUE`, split once on the first `=`
+    - values wrapped in matching single or double quotes are unwrapped, and may
+      span multiple lines (e.g. the JSON `_META` block); text after the closing
+      quote (such as a ` # comment`) is ignored; a quote that is never closed only
+      takes the rest of its own line
+    - `\\'` / `\\"` inside a quoted value unescape to the bare quote
+    - unquoted values have trailing ` # comments` stripped
+
+    Args:
+        text (str): The dotenv file contents.
+
+    Returns:
+        Dict[str, str]: Keys mapped to their (unquoted) values, in file order.
+    """
+    values: Dict[str, str] = {}
+    lines = text.split("\n")
+    i, count = 0, len(lines)
+
+    while i < count:
+        line = lines[i].strip()
+        i += 1
+        if not line or line[0] == "#" or "=" not in line:
+            continue
+
+        key, value = line.split("=", 1)
+        key = key.strip()
+        value = value.strip()
+
+        if value and value[0] in QUOTES:
+            quote = value[0]
+            rest = value[1:]
+            end = _find_close(rest, quote)
+            buffer: List[str] = []
+            resume = i
+            # No closing quote on this line: keep consuming lines until one has it
+            while end < 0 and i < count:
+                buffer.append(rest)
+                rest = lines[i].rstrip()
+                i += 1
+                end = _find_close(rest, quote)
+            if end < 0:
+                # Never closed: keep only this line's value and parse the following lines as usual
+                buffer, rest, i = [], value[1:], resume
+            # Anything after the closing quote (e.g. ` # comment`) is dropped
+            buffer.append(rest if end < 0 else rest[:end])
+            value = "\n".join(buffer).replace("\\" + quote, quote)
+        elif " #" in value:
+            value = value.split(" #", 1)[0].rstrip()
+
+        values[key] = value
+
+    return values
+
+
+def _find_close(chunk: str, quote: str) -> int:
+    """Index of the first `quote` in `chunk` not escaped by a backslash, or -1."""
+    pos = chunk.find(quote)
+    while pos > 0 and chunk[pos - 1] == "\\":
+        pos = chunk.find(quote, pos + 1)
+    return pos
@@ -7,31 +7,62 @@ Command-line interface for the AGE MCP server, providing commands to run and man
 This module uses Click for CLI parsing and Rich for enhanced console output.
 """
 
-import json, os
+import json, os, sys
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from textwrap import dedent
-from typing import Any, Dict, List, Self, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, List, Self, TypeVar
 
 import click
 
-from dotenv import dotenv_values, get_key, set_key
-from rich.console import Console, Group
-from rich.panel import Panel
-from rich.prompt import Prompt
-from rich.table import Table
-from rich.traceback import install as install_traceback
-
+from agemcp._fastenv import parse as parse_dotenv
 from agemcp.environment import Environment
-from agemcp.settings import get_settings
+
+
+if TYPE_CHECKING:
+    from rich.console import Console, Group
+
+    from agemcp.settings import Settings
 
 
 ENV_PATH = Environment.get_dotenv_path()
 ENV_EXAMPLE_PATH = Path(__file__).parent / ".env.example"
 
-console = Console()
-install_traceback(show_locals=True, word_wrap=True, console=console)
+_TRACEBACK_INSTALLED = False
+
+
+@lru_cache(maxsize=1)
+def _get_console() -> "Console":
+    """The shared Rich console, created on first use so `--help` never pays for Rich."""
+    from rich.console import Console
+    return Console()
+
+def __getattr__(name: str) -> Any:
+    """Lazily bind `console` on first attribute access (PEP 562)."""
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _get_settings() -> "Settings":
+    """Import and return the settings singleton on demand (pydantic is only loaded when needed)."""
+    from agemcp.settings import get_settings
+    return get_settings()
+
+def _install_traceback() -> None:
+    """Install Rich tracebacks when AGEMCP_RICH_TB is set (and stderr is a terminal).
+
+    Rich's `show_locals` reprs every local in every frame, which is slow on pydantic-heavy
+    tracebacks, so the default Python excepthook is kept unless explicitly requested.
+    Called from command bodies so `--help` paths never load Rich.
+    """
+    global _TRACEBACK_INSTALLED
+    if _TRACEBACK_INSTALLED or not os.environ.get("AGEMCP_RICH_TB") or not sys.stderr.isatty():
+        return
+    from rich.traceback import install as install_traceback
+    install_traceback(show_locals=True, word_wrap=True, console=_get_console())
+    _TRACEBACK_INSTALLED = True
 
 def init_settings() -> None:
     """Ensure that a .env file exists, before get_settings() is called, created from the .env.example file if missing."""
@@ -43,7 +74,7 @@ def init_settings() -> None:
     ENV_PATH.write_text(ENV_EXAMPLE_PATH.read_text())
 
     
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Setting:
     name: str
     desc: str
@@ -53,6 +84,15 @@ class Setting:
     example: str | None
 
     value: str | None
+
+    _choice_index: Dict[str, str] = field(init=False, repr=False, compare=False)
+    _choice_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    _panel: "Group | None" = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Lookup tables for validating answers: "1".."N" shortcuts and the valid choices.
+        self._choice_index = {str(i + 1): choice for i, choice in enumerate(self.choices or [])}
+        self._choice_set = frozenset(self.choices or ())
     
     @property
     def is_required(self) -> bool:
@@ -79,8 +119,15 @@ class Setting:
             value=None
         )
 
-    def panel_part(self) -> Group:
-        """The render group that contains a nice looking panel above the prompt given to the user"""
+    @property
+    def panel_part(self) -> "Group":
+        """The render group that contains a nice looking panel above the prompt given to the user (built once)."""
+        if self._panel is not None:
+            return self._panel
+
+        from rich.console import Group
+        from rich.panel import Panel
+
         text = [
             f"[bold cyan]{self.desc}[/bold cyan]"
         ]
@@ -105,11 +152,15 @@ class Setting:
             text.append(f"[cyan]Default: [/cyan][dim](Chosen if empty value)[/dim]")
             text.append(f"    - {self.default}")
             
-        return Group(*[Panel.fit("\n".join(text), title=f"Configure: {self.name}", border_style="blue")])
+        self._panel = Group(Panel.fit("\n".join(text), title=f"Configure: {self.name}", border_style="blue"))
+        return self._panel
     
     def ask(self):
         """Asks the prompt and sets the value to self.value"""
-        console.print(self.panel_part())
+        from rich.prompt import Prompt
+
+        console = _get_console()
+        console.print(self.panel_part)
         default = self.default if self.default else None
         while True:
             val = Prompt.ask(f"Value", default=default, show_default=False, show_choices=False)
@@ -117,14 +168,10 @@ class Setting:
 
             if self.choices:
                 # Check for integer choice short-cut
-                try:
-                    if int(val) in [(i+1) for i, _ in enumerate(self.choices)]:
-                        val = self.choices[int(val) - 1]
-                except ValueError:
-                    pass
+                val = self._choice_index.get(val, val)
 
                 # Check if valid choice.
-                if val not in self.choices:
+                if val not in self._choice_set:
                     console.print("[bold red]Invalid choice, pick one the available options.[/bold red]")
                     continue
 
@@ -143,40 +190,49 @@ class Setting:
         
 
 
-@dataclass
+@lru_cache(maxsize=8)
+def _parse_dotenv(path_str: str, mtime_ns: int) -> Dict[str, str | None]:
+    """Parse a dotenv file once per (path, mtime); a changed file produces a new cache key."""
+    return dict(parse_dotenv(Path(path_str).read_text()))
+
+def read_dotenv(path: Path) -> Dict[str, str | None]:
+    """Read a dotenv file through the parse cache, returning a copy safe to mutate."""
+    if not path.exists():
+        return {}
+    return dict(_parse_dotenv(str(path), path.stat().st_mtime_ns))
+
+
+@dataclass(slots=True)
 class DotEnvFile:
     path: Path
 
-    _values = {}
+    _values: Dict[str, str | None] | None = field(default=None, init=False, repr=False)
 
     @property
     def values(self) -> Dict[str, str | None]:
-        if not self._values:
-            self._values = dotenv_values(self.path)
+        if self._values is None:
+            self._values = read_dotenv(self.path)
         return self._values
 
     def set(self, key: str, value: str | None) -> None:
-        self._values[key] = value
+        self.values[key] = value
 
     def get(self, key: str, default: str | None = None) -> str | None:
         """Get a value from the .env file, returning default if not found."""
-        return self._values.get(key, default)
+        return self.values.get(key, default)
 
     def save(self) -> None:
-        if not self.path.exists():
-            self.path.write_text("")
-
-        # Remove _META key before saving (in memory and on disk)
-        if "_META" in self._values:
-            del self._values["_META"]
-            try:
-                from dotenv import unset_key
-                unset_key(self.path, "_META")
-            except ImportError:
-                pass
+        """Write all values to disk in a single pass (the _META key is never persisted)."""
+        self.values.pop("_META", None)
 
+        lines = []
         for key, value in self.values.items():
-            set_key(self.path, key, str(value))
+            if value is None:
+                continue
+            escaped = str(value).replace("'", "\\'")
+            lines.append(f"{key}='{escaped}'")
+
+        self.path.write_text("\n".join(lines) + "\n")
 
     @classmethod
     def from_path(cls, path: Path | str) -> Self:
@@ -192,18 +248,21 @@ def cli(ctx: click.Context) -> None:
 
 
 @cli.command()
-def config() -> None:
+@click.option('--force', is_flag=True, help='Prompt for every setting even if all are already configured.')
+@click.option('--only', multiple=True, metavar='NAME', help='Only prompt for the named setting (repeatable), e.g. --only DB__DSN.')
+def config(force: bool, only: tuple[str, ...]) -> None:
     """Update / create configuration settings."""
 
+    _install_traceback()
     init_settings()
-    console = Console()
+    console = _get_console()
     env_path = ENV_PATH
     
             
 
     def get_settings_from_meta_config() -> List[Setting]:
         env_example_path = ENV_EXAMPLE_PATH
-        env_example = dotenv_values(env_example_path)
+        env_example = read_dotenv(env_example_path)
         meta_str = env_example.get("_META")
         if not meta_str:
             console.print("[bold red]No _META found in .env.example.[/bold red]")
@@ -229,26 +288,43 @@ def config() -> None:
     # Load .env and parse _META
     env_file = DotEnvFile.from_path(env_path)
     
-    # print all values from it
-    existing_values = {key: value for key, value in env_file.values.items()}
-    
-
+    # Read-only view of the values already on disk (no copy needed)
+    existing_values = env_file.values
+
+    if only:
+        unknown = set(only) - {setting.name for setting in settings}
+        if unknown:
+            raise click.BadParameter(f"Unknown setting(s): {', '.join(sorted(unknown))}", param_hint="--only")
+        selected = set(only)
+    else:
+        # A .env still carrying _META was copied from .env.example and never saved by `config`.
+        configured = "_META" not in existing_values
+        missing = [setting for setting in settings if setting.is_required and not existing_values.get(setting.name)]
+        if configured and not missing and not force:
+            from rich.table import Table
+
+            table = Table(title="Current configuration")
+            table.add_column("Setting", style="cyan")
+            table.add_column("Value")
+            for setting in settings:
+                table.add_row(setting.name, str(existing_values.get(setting.name) or ""))
+            console.print(table)
+            console.print("[dim]All settings are configured. Use --force to review all of them, or --only NAME to change one.[/dim]")
+            return
+        selected = {setting.name for setting in settings}
+
+    # Single pass: hydrate from the existing value, ask, then stage the answer
     for setting in settings:
-
         if val := existing_values.get(setting.name):
             console.print(f"[dim]>>> Found existing value for {setting.name}: {val}[/dim]")
             setting.value = val
             setting.default = val
 
-    # Now, iterate over each setting, asking them
-    # to fill out the settings
-    for setting in settings:
-        setting.ask()
-        
-    # Now, update the env_file with the new setting.value's and save it
-    for setting in settings:
-        env_file.set(setting.name, setting.value)
-        
+        if setting.name in selected:
+            setting.ask()
+            env_file.set(setting.name, setting.value)
+
+    # One write for the whole command
     env_file.save()
 
 if ENV_PATH.exists():
@@ -256,14 +332,24 @@ if ENV_PATH.exists():
     @cli.command()
     def settings() -> None:
         """Show all current configuration settings."""
-        console.print(get_settings().model_dump_json(indent=4))
+        _install_traceback()
+        dumped = _get_settings().model_dump_json(indent=4)
+        # Piped output (e.g. `agemcp settings | jq`) skips Rich's markup/segment pipeline
+        if not sys.stdout.isatty():
+            sys.stdout.write(dumped)
+            sys.stdout.write("\n")
+            return
 
+        _get_console().print(dumped)
 
+
+    # Callable defaults are only evaluated by Click when the option is omitted on an
+    # actual invocation, so `--help` and argument errors never build the settings.
     @cli.command()
-    @click.option('--port', default=get_settings().mcp.port, help='Port to run the server on.')
-    @click.option('--host', default=get_settings().mcp.host, help='Host to run the server on.')
-    @click.option('--transport', type=click.Choice(['sse', 'streamable-http', 'stdio']), help='Transport to use.', default=get_settings().mcp.transport)
-    @click.option('--log-level', type=click.Choice(['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']), default=get_settings().mcp.log_level, help='Log level to use.')
+    @click.option('--port', type=int, default=lambda: _get_settings().mcp.port, show_default="from .env", help='Port to run the server on.')
+    @click.option('--host', default=lambda: _get_settings().mcp.host, show_default="from .env", help='Host to run the server on.')
+    @click.option('--transport', type=click.Choice(['sse', 'streamable-http', 'stdio']), help='Transport to use.', default=lambda: _get_settings().mcp.transport, show_default="from .env")
+    @click.option('--log-level', type=click.Choice(['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']), default=lambda: _get_settings().mcp.log_level, show_default="from .env", help='Log level to use.')
     def run(port: int, host: str, transport: str, log_level: str) -> None:
         """Launch the AGEMCP server.
 
@@ -280,11 +366,12 @@ if ENV_PATH.exists():
 
         from fastmcp.cli.run import LogLevelType, TransportType, run_command
 
-        spec = get_settings().app.package_path / "server.py"
-        server_spec = str(spec)
-        # Log for debug/info
-        if log_level in ["DEBUG", "INFO"]:
-            console.log(f"Running server via direct import: {server_spec}")
+        _install_traceback()
+
+        server_spec = str(_get_settings().app.package_path / "server.py")
+        # Log for debug/info (the message is only formatted when it will be shown)
+        if log_level in ("DEBUG", "INFO") and sys.stdout.isatty():
+            _get_console().log(f"Running server via direct import: {server_spec}")
 
         # Map CLI args to run_command
         asyncio.run(run_command(
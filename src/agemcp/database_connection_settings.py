@@ -1,6 +1,7 @@
+import asyncio
+
 from contextlib import asynccontextmanager
-from contextvars import ContextVar
-from typing import AsyncGenerator, Self
+from typing import Any, AsyncGenerator, Self
 
 from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from pydantic.types import SecretStr
@@ -11,11 +12,6 @@ from typing_extensions import Literal
 from agemcp.data_source_name import DataSourceName
 
 
-# ContextVar-based caches for event-loop safety
-_async_engine_ctx: ContextVar[AsyncEngine | None] = ContextVar("_async_engine_ctx", default=None)
-_async_sessionmaker_ctx: ContextVar[async_sessionmaker | None] = ContextVar("_async_sessionmaker_ctx", default=None)
-
-
 class DatabaseConnectionSettings(BaseModel):
     """
     Configuration for a single database connection.
@@ -47,6 +43,8 @@ class DatabaseConnectionSettings(BaseModel):
     Methods:
         from_name_and_dsn(name: str, dsn: str) -> Self
             : Create a DatabaseConnection instance from a name and DSN string or DataSourceName.
+        from_trusted_dict(data: dict[str, Any]) -> Self
+            : Create an instance from already-validated data without running validation.
         sqlalchemy_dispose_async_engine() -> None
             : Dispose the SQLAlchemy async engine if it exists.
         sqlalchemy_async_engine() -> AsyncEngine
@@ -74,7 +72,7 @@ class DatabaseConnectionSettings(BaseModel):
     pool_max_idle_time        : int | None           = Field(default=300,    description="Maximum idle time for connections in the pool (seconds)")
     pool_max_lifetime         : int | None           = Field(default=3600,   description="Maximum lifetime for connections in the pool (seconds)")
     pool_recycle_time         : int | None           = Field(default=1800,   description="Time after which connections are recycled (seconds)")
-    pool_pre_ping             : bool                 = Field(default=True,   description="Enable pre-ping to check connection health")
+    pool_pre_ping             : bool                 = Field(default=False,  description="Enable pre-ping (an extra roundtrip on every checkout) to check connection health")
     pool_max_overflow         : int | None           = Field(default=10,     description="Number of connections that can be created beyond the pool size limit")
 
     keepalives                : bool                 = Field(default=True,   description="Enable TCP keepalives")
@@ -84,6 +82,7 @@ class DatabaseConnectionSettings(BaseModel):
 
 
     _sqlalchemy_async_engine: AsyncEngine | None = PrivateAttr(default=None)
+    _engine_lock: asyncio.Lock | None = PrivateAttr(default=None)
     _sqlalchemy_async_sessionmaker: async_sessionmaker | None = PrivateAttr(default=None)
 
     @field_validator('dsn', mode='before')
@@ -147,39 +146,72 @@ class DatabaseConnectionSettings(BaseModel):
         })
 
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict[str, Any]) -> Self:
+        """Create an instance from already-validated data, skipping pydantic validation.
+
+        Only for trusted input (e.g. values produced by `model_dump()` of another instance).
+        A dumped `dsn` (a plain dict) is turned back into a `DataSourceName`; a DSN string is
+        not parsed. Use `from_name_and_dsn` / `model_validate` for anything else.
+        """
+        if isinstance(dsn := data.get("dsn"), dict):
+            data = {**data, "dsn": DataSourceName.model_validate(dsn)}
+        return cls.model_construct(**data)
+
+
     async def sqlalchemy_dispose_async_engine(self) -> None:
         """Dispose the SQLAlchemy async engine if it exists."""
         if self._sqlalchemy_async_engine and isinstance(self._sqlalchemy_async_engine, AsyncEngine):
             await self._sqlalchemy_async_engine.dispose()
             self._sqlalchemy_async_engine = None
+            self._sqlalchemy_async_sessionmaker = None
+            # A rebuilt engine may live on another event loop; don't carry over a loop-bound lock
+            self._engine_lock = None
     
     async def sqlalchemy_async_engine(self) -> AsyncEngine:
-        """Get or create the SQLAlchemy async engine for this connection, event-loop safe."""
-        engine = _async_engine_ctx.get()
-        if engine is None:
-            engine_kwargs = {
-                "echo": self.echo,
-                # "encoding": self.encoding,  # Removed: asyncpg does not support this argument
-                "pool_size": self.pool_min_connections,
-                "max_overflow": self.pool_max_overflow,
-                "pool_timeout": self.connection_timeout,
-                "pool_recycle": self.pool_recycle_time,
-                "pool_pre_ping": self.pool_pre_ping,
-                "pool_use_lifo": False,
-                "future": True
-            }
-            engine_kwargs = {k: v for k, v in engine_kwargs.items() if v is not None}
-            engine = create_async_engine(str(self.dsn), **engine_kwargs)
-            _async_engine_ctx.set(engine)
-        return engine
+        """Get or create the SQLAlchemy async engine for this connection.
+
+        The engine (and its pool) is created at most once per instance: the hot path is a
+        lock-free attribute check, and concurrent first callers serialize on a lock and
+        re-check before building.
+        """
+        if self._sqlalchemy_async_engine is not None:
+            return self._sqlalchemy_async_engine
+
+        self._engine_lock = self._engine_lock or asyncio.Lock()
+        async with self._engine_lock:
+            if self._sqlalchemy_async_engine is None:
+                # Optional (nullable) settings are only passed when set; the rest always are.
+                # "encoding" is intentionally absent: asyncpg does not support this argument.
+                # SQLAlchemy's pool_size is the steady-state pool size, i.e. our max connections.
+                # Connections are recycled at whichever of max lifetime / recycle time comes first.
+                recycle_times = [t for t in (self.pool_max_lifetime, self.pool_recycle_time) if t is not None]
+                optional_kwargs = (
+                    ("pool_size",    self.pool_max_connections),
+                    ("max_overflow", self.pool_max_overflow),
+                    ("pool_timeout", self.connection_timeout),
+                    ("pool_recycle", min(recycle_times) if recycle_times else None),
+                )
+                engine_kwargs = {
+                    "echo": self.echo,
+                    "pool_pre_ping": self.pool_pre_ping,
+                    # LIFO keeps a small hot set of backend connections in use (warm caches)
+                    "pool_use_lifo": True,
+                    "future": True,
+                }
+                for key, value in optional_kwargs:
+                    if value is not None:
+                        engine_kwargs[key] = value
+                # Not str(self.dsn): that is the masked, display-safe form of the DSN
+                self._sqlalchemy_async_engine = create_async_engine(self.dsn.model_dump_string(), **engine_kwargs)
+        return self._sqlalchemy_async_engine
 
     async def sqlalchemy_sessionmaker(self) -> async_sessionmaker:
-        sessionmaker = _async_sessionmaker_ctx.get()
-        if sessionmaker is None:
+        """Get or create the sessionmaker bound to this connection's engine (shares the engine's lifetime)."""
+        if self._sqlalchemy_async_sessionmaker is None:
             engine = await self.sqlalchemy_async_engine()
-            sessionmaker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-            _async_sessionmaker_ctx.set(sessionmaker)
-        return sessionmaker
+            self._sqlalchemy_async_sessionmaker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        return self._sqlalchemy_async_sessionmaker
 
     @asynccontextmanager
     async def sqlalchemy_session(self) -> AsyncGenerator[AsyncSession, None]:
@@ -202,8 +234,8 @@ class DatabaseConnectionSettings(BaseModel):
             AsyncSession with an active transaction (committed or rolled back on exit).
         """
         async with self.sqlalchemy_session() as session:
-            if isolation_level is not None:
-                conn = await session.connection()
-                await conn.execution_options(isolation_level=isolation_level)
             async with session.begin():
+                if isolation_level is not None:
+                    # Applied as the session procures its connection, before any statement runs
+                    await session.connection(execution_options={"isolation_level": isolation_level})
                 yield session
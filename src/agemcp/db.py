@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-import json
+import re
 
 from collections import UserList
 from contextlib import AbstractAsyncContextManager, AsyncContextDecorator, AsyncExitStack
-from dataclasses import asdict, dataclass, field
-from typing import Any, Dict, List, Literal, Self, TypeVar
+from dataclasses import dataclass, field, fields
+from functools import cache
+from typing import Any, Dict, List, Literal, Self, Tuple, TypeVar
+
+import orjson
 
 from sqlalchemy.engine import Row
 from sqlalchemy.orm import declarative_base
@@ -21,7 +24,7 @@ def decode_record(record: Row) -> dict:
     """
     Decodes a single SQLAlchemy Row object containing AGE agtype strings into a dictionary.
 
-    Iterates through each key-value pair in the Row. If a value is a string containing '::',
+    Iterates through each key-value pair of the Row's mapping. If a value is a string containing '::',
     it is assumed to be an agtype string and is decoded using `decode_agtype_string`.
     Otherwise, the value is added as-is.
 
@@ -31,18 +34,40 @@ def decode_record(record: Row) -> dict:
     Returns:
         dict: A dictionary with decoded agtype values where applicable.
     """
-    result = {}
-    for key, value in record.items():
-        if isinstance(value, str) and '::' in value:
-            # This is an agtype string, decode it
-            value = decode_agtype_string(value)
-        result[key] = value
-    return result
+    # `type(...) is str` is safe here: drivers hand back agtype values as plain `str`
+    return {
+        key: decode_agtype_string(value) if type(value) is str and '::' in value else value
+        for key, value in record._mapping.items()
+    }
+
+# A JSON string literal (kept as-is, so `::` inside property values survives) or an inline
+# entity annotation directly after a closing `}` / `]`, as in `[{...}::vertex, {...}::vertex]`
+_INLINE_ANNOTATION = re.compile(r'"(?:[^"\\]|\\.)*"|(?<=[}\]])::(?:vertex|edge|path)\b')
+
+def _strip_inline_annotation(match: re.Match) -> str:
+    token = match.group()
+    return token if token[0] == '"' else ''
+
+def _strip_type_suffix(agtype_string: str) -> str:
+    """Drop agtype `::<type>` annotations, leaving any `::` inside JSON strings untouched.
+
+    Removes a trailing suffix (e.g. '::vertex', '::numeric') and the `::vertex` / `::edge` /
+    `::path` annotations AGE writes after each entity inside lists (e.g. `collect(n)`, `nodes(p)`).
+    """
+    idx = agtype_string.rfind('::')
+    if idx < 0:
+        return agtype_string
+    if agtype_string[idx + 2:].isidentifier():
+        agtype_string = agtype_string[:idx]
+    if '}::' in agtype_string or ']::' in agtype_string:
+        agtype_string = _INLINE_ANNOTATION.sub(_strip_inline_annotation, agtype_string)
+    return agtype_string
 
 def decode_agtype_string(agtype_string: str) -> Any:
     """Decodes a single agtype string into a Python object.
 
-    This function attempts to parse the input agtype string as either a JSON object or array.
+    This function attempts to parse the input agtype string as either a JSON object or array
+    (dispatching on its first character, and ignoring any `::<type>` annotations).
     If the string does not match these formats, it returns the string itself.
 
     Args:
@@ -51,24 +76,27 @@ def decode_agtype_string(agtype_string: str) -> Any:
     Returns:
         Any: The decoded Python object, or the original string if decoding is not possible.
     """
-    # Placeholder implementation - replace with actual decoding logic
-    if agtype_string.startswith('{') and agtype_string.endswith('}'):
-        # This looks like a JSON object
-        return json.loads(agtype_string)
-    elif agtype_string.startswith('[') and agtype_string.endswith(']'):
-        # This looks like a JSON array
-        return json.loads(agtype_string)
-    else:
-        # Fallback to returning the string itself
+    if not agtype_string:
+        return agtype_string
+
+    first = agtype_string[0]
+    if first != '{' and first != '[':
+        return agtype_string
+
+    try:
+        # Drop `::vertex` / `::edge` style annotations if present
+        return orjson.loads(_strip_type_suffix(agtype_string))
+    except orjson.JSONDecodeError:
+        # Not JSON after all, fall back to returning the string itself
         return agtype_string
 
 def decode_asyncio_agtype_recordset(records: list[Row]) -> list[dict]:
     """Decodes a list of asyncpg.Record objects containing AGE agtype strings.
 
-    Efficiently decodes a list of asyncpg.Record objects containing AGE agtype strings
-    into a list of dictionaries, using a single json.loads call on a constructed JSON array.
-    This version concatenates all agtype strings with commas, replaces '::vertex' and '::edge' with '',
-    and wraps the result in brackets.
+    Decodes each agtype string on its own with orjson after slicing off its trailing type
+    suffix, if any (e.g. '::vertex', '::edge'), writing the results into a pre-sized list. Unlike
+    parsing one concatenated JSON array, peak memory stays bounded by the largest single
+    value rather than the whole recordset.
 
     Args:
         records (list[Row]): A list of asyncpg.Record or SQLAlchemy Row objects containing agtype strings.
@@ -76,24 +104,32 @@ def decode_asyncio_agtype_recordset(records: list[Row]) -> list[dict]:
     Returns:
         list[dict]: A list of dictionaries decoded from the agtype strings. Returns an empty list if no agtype strings are found.
     """
-    agtype_strings = [
-        value for record in records
-        for value in (record._mapping.values() if hasattr(record, '_mapping') else record.values())
-        if isinstance(value, str) and '::' in value
-    ]
-    if not agtype_strings:
+    if not records:
         return []
 
-    # Concatenate all objects into one string, separated by commas
-    concat = ','.join(agtype_strings)
-    # Remove both ::vertex and ::edge suffixes from the string
-    concat = concat.replace('::vertex', '')
-    concat = concat.replace('::edge',   '')
-    # Wrap in brackets to form a JSON array
-    json_array = '[' + concat + ']'
-    return json.loads(json_array)
-
-@dataclass
+    # Every row of a recordset has the same type: decide once how to get at its values
+    if hasattr(records[0], '_mapping'):
+        agtype_strings = [
+            value for record in records for value in record._mapping.values()
+            if type(value) is str and '::' in value
+        ]
+    else:
+        agtype_strings = [
+            value for record in records for value in record.values()  # type: ignore[attr-defined]
+            if type(value) is str and '::' in value
+        ]
+
+    decoded: list = [None] * len(agtype_strings)
+    for i, agtype_string in enumerate(agtype_strings):
+        decoded[i] = orjson.loads(_strip_type_suffix(agtype_string))
+    return decoded
+
+@cache
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """The dataclass field names of a record class, computed once per class."""
+    return tuple(f.name for f in fields(cls))
+
+@dataclass(slots=True)
 class DbRecord:
     """Base class for database records.
 
@@ -103,24 +139,28 @@ class DbRecord:
     
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert the record to a dictionary."""
-        return asdict(self, dict_factory=dict)
+        """Convert the record to a (shallow) dictionary of its fields."""
+        return {name: getattr(self, name) for name in _field_names(type(self))}
     
     def to_json(self) -> str:
         """Convert the record to a JSON string."""
-        return json.dumps(self.to_dict(), default=str)
+        return self.to_json_bytes().decode()
+
+    def to_json_bytes(self) -> bytes:
+        """Convert the record to UTF-8 encoded JSON bytes (skips the str decode of `to_json`)."""
+        return orjson.dumps(self.to_dict(), default=str, option=orjson.OPT_NON_STR_KEYS)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Self:
         return cls(**data)
     
     @classmethod
-    def from_json(cls, json_data: str) -> Self:
-        """Convert a JSON string into a record."""
-        data = json.loads(json_data)
+    def from_json(cls, json_data: str | bytes) -> Self:
+        """Convert a JSON string (or bytes) into a record."""
+        data = orjson.loads(json_data)
         return cls.from_dict(data)
 
-@dataclass
+@dataclass(slots=True)
 class AgtypeRecord(DbRecord):
     """Represents an AGE agtype record.
 
@@ -141,22 +181,27 @@ class AgtypeRecord(DbRecord):
             raise TypeError("AgtypeRecord requires a 'label' field.")
         if self.properties is None:
             self.properties = {}
+        # Resolve the record type once, so the accessors below are plain attribute reads
+        if self._type is None:
+            self._type = 'edge' if self.start_id is not None and self.end_id is not None else 'vertex'
 
     @property
     def type(self) -> Literal['vertex', 'edge']:
-        """Determine if this record is a vertex or an edge based on its properties."""
-        if self._type is not None:
-            return self._type # faster if set.
-        return 'edge' if self.start_id is not None and self.end_id is not None else 'vertex'
+        """Whether this record is a vertex or an edge (explicit `_type`, else inferred from start/end ids at init)."""
+        return self._type # pyright: ignore
     
     @property
-    def is_vertex(self) -> bool: return self.type == 'vertex'
+    def is_vertex(self) -> bool: return self._type == 'vertex'
     
     @property
-    def is_edge(self) -> bool: return self.type == 'edge'
+    def is_edge(self) -> bool: return self._type == 'edge'
 
     @classmethod
     def from_raw_records(cls, records: List[Row]) -> List[Self]:
         """Convert a list of asyncpg.Record to a list of DbRecord."""
         dicts : List[Dict] = decode_asyncio_agtype_recordset(records)
-        return [cls.from_dict(record) for record in dicts]
+        # Positional construction in field order: skips the `**data` kwargs dict per record
+        return [
+            cls(d.get('label'), d.get('properties') or {}, d.get('id'), d.get('start_id'), d.get('end_id'), d.get('_type'))  # pyright: ignore
+            for d in dicts
+        ]
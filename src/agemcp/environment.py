@@ -40,8 +40,7 @@ class Environment(Enum):
     @classmethod
     def current(cls) -> Self:
         """Get the current environment from the APP_ENV environment variable."""
-        os.environ.setdefault(OS_ENV_KEY, "development")
-        app_env = os.environ[OS_ENV_KEY].lower()
+        app_env = os.environ.setdefault(OS_ENV_KEY, "development").lower()
         return cls(app_env)
 
     @classmethod
@@ -69,11 +68,12 @@ class Environment(Enum):
         if cls.is_pipx_facility():
             return '.agempc.env'
 
-        # if dev, assume it's just a plain .env
-        if cls.current() == cls.DEVELOPMENT:
-            return f".{basename}"
-        
-        return f".{basename}.{cls.current().value}"
+        match cls.current():
+            # if dev, assume it's just a plain .env
+            case cls.DEVELOPMENT:
+                return f".{basename}"
+            case env:
+                return f".{basename}.{env.value}"
 
     @classmethod
     def get_dotenv_path(cls) -> Path:
@@ -1,10 +1,11 @@
-from collections import OrderedDict
 from typing import Callable, Generic, Tuple, TypeVar
 
 
 K = TypeVar('K')
 V = TypeVar('V')
 
+_MISSING = object() # sentinel, distinguishes "absent" from a cached None
+
 class LRUCache(Generic[K, V]):
     """
     An in-memory Least Recently Used (LRU) cache for key-value pairs, supporting arbitrary types via generics.
@@ -29,21 +30,24 @@ class LRUCache(Generic[K, V]):
     """
 
     def __init__(self, max_size: int = 100):
-        self._cache : OrderedDict[K, V] = OrderedDict()
+        # Plain dicts keep insertion order, so the first key is always the least recently used
+        self._cache : dict[K, V] = {}
         self.max_size = max_size
 
     def get(self, key: K) -> V | None:
-        if key not in self._cache:
+        cache = self._cache
+        value = cache.pop(key, _MISSING)
+        if value is _MISSING:
             return None
-        self._cache.move_to_end(key) # magic (use the move_to_end unique to OrderedDict as a way to indicate recent access)
-        return self._cache[key]
+        cache[key] = value # re-insert to mark as most recently used
+        return value # pyright: ignore
 
     def put(self, key: K, value: V) -> None:
-        if key in self._cache:
-            del self._cache[key]
-        elif len(self._cache) >= self.max_size:
-            self._cache.popitem(last=False)
-        self._cache[key] = value
+        cache = self._cache
+        # Re-inserting an existing key never evicts; only a new key can overflow the cache
+        if cache.pop(key, _MISSING) is _MISSING and len(cache) >= self.max_size:
+            del cache[next(iter(cache))]
+        cache[key] = value
 
     def clear(self, filter: Callable[[Tuple[K, V]], bool] | None = None) -> None:
         """Clear the cache, optionally filtering which items to evict.
@@ -53,7 +57,6 @@ class LRUCache(Generic[K, V]):
         if filter is None:
             self._cache.clear()
         else:
-            keys_to_remove = [key for key, value in self._cache.items() if filter((key, value))]
-            for key in keys_to_remove:
-                del self._cache[key]
+            # Rebuild from the survivors in one pass (insertion/recency order is preserved)
+            self._cache = {key: value for key, value in self._cache.items() if not filter((key, value))}
 
@@ -1,6 +1,6 @@
-import random, secrets
+import random
 
-from typing import ClassVar, List
+from typing import ClassVar, List, Tuple
 
 
 class RoyalDescription:
@@ -20,8 +20,8 @@ class RoyalDescription:
         choose(index: int): Selects a random adjective from the reversed canonical order at the given index.
 
     Class Methods:
-        canonical_order_adjectives(): Returns the canonical order of adjective categories.
-        reversed_canonical_order_adjectives(): Returns the reversed canonical order of adjective categories.
+        canonical_order_adjectives(): Returns the canonical order of adjective categories (precomputed tuple).
+        reversed_canonical_order_adjectives(): Returns the reversed canonical order of adjective categories (precomputed tuple).
         generate(words=10, delimiter=' '): Generates a random noun phrase using the canonical adjective order.
 
     Attributes:
@@ -65,27 +65,34 @@ class RoyalDescription:
     noun     : ClassVar[List[str]] = [ "ox", "id", "ax", "boy", "toy", "ant", "bee", "pig", "hen", "owl", "fox", "cow", "yak", "ram", "kid", "mob", "cop", "dad", "mom", "nun", "son", "pal", "gal", "guy", "lad", "kin", "doc", "don", "dan", "sir", "spy", "vet", "sub", "bud", "cub", "con", "cam", "cab", "bin", "bob", "bun", "bug", "bear", "bull", "deer", "duck", "goat", "king", "lady", "lion", "lord", "maid", "monk", "pope", "stag", "wolf", "hero", "guru", "jury", "pawn", "knob", "sage", "seer", "twin", "wife", "yogi", "yarn", "yawn" ]
     
     
+    # Immutable, precomputed adjective tables (canonical order and its reverse)
+    _CANONICAL : ClassVar[Tuple[Tuple[str, ...], ...]] = tuple(tuple(category) for category in (quantity, quality, size, age, shape, color, origin, material, purpose))
+    _REVERSED  : ClassVar[Tuple[Tuple[str, ...], ...]] = _CANONICAL[::-1]
+
     def choose(self, index: int) -> str:
         if not (0 <= index <= 8):
             raise ValueError("Index must be between 0 and 8.")
-        adjectives = self.reversed_canonical_order_adjectives()[index]
-        return secrets.choice(adjectives)
+        return random.choice(self._REVERSED[index])
 
     @classmethod
-    def canonical_order_adjectives(cls) -> List[List[str]]:
-        return [ cls.quantity, cls.quality, cls.size, cls.age, cls.shape, cls.color, cls.origin, cls.material, cls.purpose ]
+    def canonical_order_adjectives(cls) -> Tuple[Tuple[str, ...], ...]:
+        return cls._CANONICAL
     
     @classmethod
-    def reversed_canonical_order_adjectives(cls) -> List[List[str]]:
-        return list(reversed(cls.canonical_order_adjectives()))
+    def reversed_canonical_order_adjectives(cls) -> Tuple[Tuple[str, ...], ...]:
+        return cls._REVERSED
 
     @classmethod
     def generate(cls, words=10, delimiter=' ') -> str:
         if not (1 <= words <= 10):
             raise ValueError("Number of words must be between 1 and 10.")
-        parts = [random.choice(cls.noun)]
-        for i in range(words - 1):
-            adjectives = cls.reversed_canonical_order_adjectives()[i]
-            adjective = random.choice(adjectives)
-            parts.insert(0, adjective)
+        reversed_adjectives = cls._REVERSED
+        # Inlined `random.choice`: one bound random() call and an index per word
+        rand = random.random
+        # Outermost adjective first (reversed table walked backwards), noun last
+        parts = [
+            (pool := reversed_adjectives[i])[int(rand() * len(pool))]
+            for i in range(words - 2, -1, -1)
+        ]
+        parts.append(cls.noun[int(rand() * len(cls.noun))])
         return delimiter.join(parts)
@@ -5,76 +5,109 @@ Supports .env files, environment variables, and runtime validation with DSN-base
 
 
 
+from dataclasses import dataclass
+from functools import cache, partial
 from pathlib import Path
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Final, List, Literal, Mapping, Self
 
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from agemcp.database_connection_settings import DatabaseConnectionSettings
 from agemcp.environment import Environment
 
 
-ENV_FILE_PATH = Environment.get_dotenv_path()
-ENV_FILE_DIR_PATH = Path(ENV_FILE_PATH).parent
+if TYPE_CHECKING:
+    from agemcp.database_connection_settings import DatabaseConnectionSettings
+
+
+ENV_FILE_PATH: Path = Environment.get_dotenv_path()
+ENV_FILE_DIR_PATH: Path = ENV_FILE_PATH.parent
+TESTING_ENV_FILE_PATH: Path = ENV_FILE_DIR_PATH / '.env.testing'
+
+_PACKAGE_PATH: Final[Path] = Path(__file__).parent
+
+LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+McpTransport = Literal["sse", "streamable-http", "stdio"]
+
+# Config shared by every settings model; settings are read-only once loaded, and unknown
+# keys are rejected (pydantic-settings' default, stated here so it can't silently drift)
+_BASE_CFG = SettingsConfigDict(env_file_encoding='utf-8', env_nested_delimiter='__', frozen=True, extra='forbid')
 
 class AppSettings(BaseSettings):
     """Main application configuration."""
 
-    log_level: str = Field(default="INFO", description="Logging level", pattern=r"^(DEBUG|INFO|WARNING|ERROR|CRITICAL)$")
+    model_config = _BASE_CFG
+
+    log_level: LogLevel = Field(default="INFO", description="Logging level")
     
     @property
-    def package_path(self) -> Path: return Path(__file__).parent
+    def package_path(self) -> Path: return _PACKAGE_PATH
 
 
 class McpSettings(BaseSettings):
     """MCP Server configuration."""
+
+    model_config = _BASE_CFG
+
     port: int = Field(default=7999, description="MCP server port")
     host: str = Field(default="0.0.0.0", description="MCP server host")
-    transport: str = Field(
-        default="streamable-http",
-        description="MCP server transport protocol",
-        pattern=r"^(sse|streamable-http|stdio)$"
-    )
-    log_level: str = Field(
-        default="DEBUG",
-        description="MCP server log level",
-        pattern=r"^(DEBUG|INFO|WARNING|ERROR|CRITICAL)$"
-    )
+    transport: McpTransport = Field(default="streamable-http", description="MCP server transport protocol")
+    log_level: LogLevel = Field(default="DEBUG", description="MCP server log level")
 
     
 class DbSettings(BaseSettings):
 
-    model_config = SettingsConfigDict( env_nested_delimiter='__')
+    model_config = _BASE_CFG
 
-    dsn: str
+    # Deliberately a plain str, not PostgresDsn/AnyUrl: the DSN may hold $VAR / ${VAR} references that
+    # DataSourceName.parse expands, and pydantic's URL types would percent-encode them first.
+    dsn: str                  = Field(..., description="Primary database DSN; environment variable references are expanded when parsed")
     echo: bool | None         = Field(default=None)
     pool_min_connections: int = Field(default=5)
     pool_max_connections: int = Field(default=10)
     pool_max_overflow: int    = Field(default=20)
+    pool_pre_ping: bool       = Field(default=False, description="Ping connections on every pool checkout (costs a roundtrip per checkout)")
+
+    _primary: "DatabaseConnectionSettings | None" = PrivateAttr(default=None)
+
+    @model_validator(mode='after')
+    def _build_primary(self) -> Self:
+        """Parse the DSN into the primary connection settings once, when the settings are loaded."""
+        # Imported here: it pulls in SQLAlchemy, which importing the settings module doesn't need
+        from agemcp.database_connection_settings import DatabaseConnectionSettings
 
-    @property
-    def connections(self) -> Dict[str, DatabaseConnectionSettings]:
         dcs = DatabaseConnectionSettings.from_name_and_dsn( "primary", self.dsn )
         dcs.pool_min_connections = self.pool_min_connections
         dcs.pool_max_connections = self.pool_max_connections
         dcs.pool_max_overflow = self.pool_max_overflow
+        dcs.pool_pre_ping = self.pool_pre_ping
+
+        self._primary = dcs
+        return self
 
-        return {
-            "primary": dcs
-        }
+    @property
+    def primary_connection(self) -> "DatabaseConnectionSettings | None":
+        """The primary connection settings, built from the DSN when the settings were loaded."""
+        return self._primary
 
-    def get_primary(self) -> DatabaseConnectionSettings:
-        if primary := self.connections.get("primary", None):
-            return primary
-        raise ValueError("Primary database connection is not defined or is invalid.")
+    @property
+    def connections(self) -> Mapping[str, "DatabaseConnectionSettings"]:
+        """The configured connections by name (a read-only view)."""
+        return MappingProxyType({"primary": self._primary} if self._primary is not None else {})
+
+    def get_primary(self) -> "DatabaseConnectionSettings":
+        if (primary := self._primary) is None:
+            raise ValueError("Primary database connection is not defined or is invalid.")
+        return primary
     
     
     
         
 
-class AgeSettings(BaseSettings):
-    """AGE-specific configuration."""
+@dataclass(slots=True, frozen=True)
+class AgeSettings:
+    """AGE-specific configuration (validated as part of `Settings`, reads no environment of its own)."""
     ident_property: str
     start_ident_property: str
     end_ident_property: str
@@ -83,11 +116,7 @@ class AgeSettings(BaseSettings):
 class Settings(BaseSettings):
     """Complete application settings with multi-database support."""
     
-    model_config = SettingsConfigDict(
-        env_file=(ENV_FILE_PATH),
-        env_file_encoding='utf-8',
-        env_nested_delimiter='__',
-    )
+    model_config = SettingsConfigDict(env_file=ENV_FILE_PATH, **_BASE_CFG)
     
     app: AppSettings
     mcp: McpSettings
@@ -95,44 +124,41 @@ class Settings(BaseSettings):
     age: AgeSettings
     env: Environment = Field(default_factory=Environment.current, description="Current application environment")
     
-    def primary_database(self) -> DatabaseConnectionSettings:
+    def primary_database(self) -> "DatabaseConnectionSettings":
         """Retrieve the primary database connection settings."""
         return self.db.get_primary()
     
-class _SettingsTesting(Settings):
-    """Settings for testing environment."""
-    
-    model_config = SettingsConfigDict(
-        env_file=(str(ENV_FILE_DIR_PATH / '.env.testing')),
-        env_file_encoding='utf-8',
-        env_nested_delimiter='__',
-    )
-    env: Environment = Field(default_factory=lambda: Environment("testing"), description="Current application environment")
-
-class _SettingsDevelopment(Settings):
-    """Settings for development environment."""
-    
-    model_config = SettingsConfigDict(
-        env_file=(str(ENV_FILE_PATH)),
-        env_file_encoding='utf-8',
-        env_nested_delimiter='__',
-    )
-    env: Environment = Field(default_factory=lambda: Environment("development"), description="Current application environment")
+
+# Settings builder per supported environment; production and staging are not supported yet.
+_BUILDERS: Dict[Environment, Callable[[], "Settings"]] = {
+    Environment.TESTING: partial(Settings, _env_file=TESTING_ENV_FILE_PATH, env=Environment.TESTING),
+    Environment.DEVELOPMENT: partial(Settings, _env_file=ENV_FILE_PATH, env=Environment.DEVELOPMENT),
+}
 
 
-# Global settings singleton
-SETTINGS: Dict[Environment,Settings] = {}
+@cache
+def _build(env: Environment) -> Settings:
+    """Build the settings for `env` (once per environment; later calls hit the cache)."""
+    try:
+        build = _BUILDERS[env]
+    except KeyError:
+        raise ValueError(f"Unsupported environment: {env.value}. Please set the environment to 'testing' or 'development'.") from None
+    return build()
+
 
 def get_settings() -> Settings:
     """Retrieve the global settings singleton with lazy environment configuration.
     
-    Implements a singleton pattern that configures Pydantic settings based on the current
-    environment when first accessed. The environment file and nested delimiter configuration
+    Builds the Pydantic settings for the current environment when first accessed and
+    caches them per environment. The environment file and nested delimiter configuration
     are applied dynamically, allowing runtime environment changes before first access.
     
     Returns:
         Settings: The configured global settings instance
         
+    Raises:
+        ValueError: If the current environment is not supported (e.g. production, staging).
+
     Example:
         >>> # Basic usage:
         >>> settings = get_settings()
@@ -144,26 +170,8 @@ def get_settings() -> Settings:
         >>> settings = get_settings()  # Uses .env.testing file
         
     Note:
-        Environment must be set before first call to take effect. Subsequent calls
-        return the cached instance regardless of environment changes.
+        Settings are built once per environment; subsequent calls for the same
+        environment return the cached instance.
     """
-    current_env = Environment.current()
-    global SETTINGS
-    if SETTINGS.get(current_env, None) is None:
-        if current_env.is_production():
-            raise ValueError("Production environment is not supported yet.")
-        elif current_env.is_staging():
-            raise ValueError("Staging environment is not supported yet.")
-        elif current_env.is_testing():
-            SETTINGS[Environment.TESTING] = _SettingsTesting()  # pyright: ignore
-        elif current_env.is_development():
-            SETTINGS[Environment.DEVELOPMENT] = _SettingsDevelopment()  # pyright: ignore
-        else:
-            raise ValueError(f"Unsupported environment: {current_env.value}. Please set the environment to 'testing' or 'development'.")
-
-    settings = SETTINGS.get(current_env, None)
-    if settings is None:
-        raise ValueError(f"Settings for environment {current_env.value} are not initialized.")
-
-    return settings
+    return _build(Environment.current())
 
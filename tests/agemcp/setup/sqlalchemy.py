@@ -1,17 +1,16 @@
 
-from agemcp.settings import get_settings
+from agemcp.apache_age import dbs
 
 
-settings = get_settings()
-dbs = settings.db.get_primary()
-
 async def close_sqlalchemy_engine() -> None:
     """Ensure that the SQLAlchemy engine is disposed of after each test function.
     
     If this is not setup then the SQLAlchemy engine will create more and more unclosed
     connections to the database, leading to resource exhaustion and test failures.
 
+    The engine lives on the DatabaseConnectionSettings instance, so this must dispose the
+    same instance the ApacheAGE repository uses.
+
     Again: This should run after each test function.
     """
     await dbs.sqlalchemy_dispose_async_engine()
-
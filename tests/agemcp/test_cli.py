@@ -0,0 +1,42 @@
+import subprocess, sys
+
+from pathlib import Path
+
+
+SRC_PATH = Path(__file__).parents[2] / "src"
+
+HELP_PROBE = """
+import os, sys
+from pathlib import Path
+from click.testing import CliRunner
+from agemcp.environment import Environment
+# `run` and `settings` are only registered once the dotenv file exists: point at a temp one
+Environment.get_dotenv_path = classmethod(lambda cls: Path(os.environ["PROBE_ENV_PATH"]))
+import agemcp.cli as cli
+assert {"config", "run", "settings"} <= set(cli.cli.commands), sorted(cli.cli.commands)
+result = CliRunner().invoke(cli.cli, ["--help"])
+assert result.exit_code == 0, result.output
+for name in cli.cli.commands:
+    result = CliRunner().invoke(cli.cli, [name, "--help"])
+    assert result.exit_code == 0, result.output
+loaded = [m for m in ("agemcp.settings", "pydantic_settings", "rich", "dotenv") if m in sys.modules]
+print(",".join(loaded))
+"""
+
+
+class TestCliColdStart:
+    def test_help_does_not_build_settings_or_load_rich(self, tmp_path):
+        """
+        Should render `--help` for the group and every subcommand without importing the
+        settings module, pydantic-settings, Rich or python-dotenv (run in a fresh interpreter).
+        """
+        env_path = tmp_path / ".env.testing"
+        env_path.write_text("")
+        result = subprocess.run(
+            [sys.executable, "-c", HELP_PROBE],
+            capture_output=True,
+            text=True,
+            env={"PYTHONPATH": str(SRC_PATH), "APP_ENV": "testing", "PROBE_ENV_PATH": str(env_path)},
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == ""
@@ -0,0 +1,96 @@
+from types import SimpleNamespace
+
+from agemcp.db import AgtypeRecord, decode_agtype_string, decode_asyncio_agtype_recordset, decode_record
+
+
+def row(*values):
+    """A minimal stand-in for a SQLAlchemy Row (exposes `_mapping`)."""
+    return SimpleNamespace(_mapping={f"c{i}": value for i, value in enumerate(values)})
+
+
+VERTEX = '{"id": 1, "label": "Human", "properties": {"ident": "gomez", "note": "a::b"}}::vertex'
+EDGE = '{"id": 11, "label": "MARRIED_TO", "start_id": 1, "end_id": 2, "properties": {}}::edge'
+
+
+class TestDecodeAgtypeString:
+    def test_decodes_objects_and_arrays(self):
+        """Should JSON-decode values that start with '{' or '['."""
+        assert decode_agtype_string('{"a": 1}') == {"a": 1}
+        assert decode_agtype_string('[1, 2]') == [1, 2]
+
+    def test_strips_type_suffix(self):
+        """Should ignore a trailing '::vertex' style suffix."""
+        assert decode_agtype_string(VERTEX)["properties"]["note"] == "a::b"
+
+    def test_decodes_lists_of_annotated_entities(self):
+        """Should strip per-entity annotations inside a list while keeping '::' in property values."""
+        decoded = decode_agtype_string(f"[{VERTEX}, {EDGE}]")
+        assert [d["id"] for d in decoded] == [1, 11]
+        assert decoded[0]["properties"]["note"] == "a::b"
+
+    def test_returns_non_json_strings_unchanged(self):
+        """Should return plain strings (and strings that only look like JSON) as-is."""
+        assert decode_agtype_string("") == ""
+        assert decode_agtype_string("plain::text") == "plain::text"
+        assert decode_agtype_string("[draft]::text") == "[draft]::text"
+
+    def test_returns_json_with_trailing_text_unchanged(self):
+        """Should not drop trailing characters that are not a '::<type>' suffix."""
+        assert decode_agtype_string("[1, 2]x") == "[1, 2]x"
+        assert decode_agtype_string('{"a":1}!') == '{"a":1}!'
+
+
+class TestDecodeRecord:
+    def test_decodes_only_agtype_values(self):
+        """Should decode agtype strings and pass every other value through untouched."""
+        decoded = decode_record(row(VERTEX, "plain", 7))  # type: ignore[arg-type]
+        assert decoded["c0"]["id"] == 1
+        assert decoded["c1"] == "plain"
+        assert decoded["c2"] == 7
+
+
+class TestDecodeAsyncioAgtypeRecordset:
+    def test_empty_recordset(self):
+        """Should return an empty list when there are no agtype values."""
+        assert decode_asyncio_agtype_recordset([]) == []
+        assert decode_asyncio_agtype_recordset([row("plain", 1)]) == []
+
+    def test_decodes_vertices_and_edges_in_order(self):
+        """Should strip the type suffixes and decode every agtype value in record order."""
+        decoded = decode_asyncio_agtype_recordset([row(VERTEX), row(EDGE)])
+        assert [d["id"] for d in decoded] == [1, 11]
+        assert decoded[1]["start_id"] == 1 and decoded[1]["end_id"] == 2
+
+    def test_keeps_double_colons_inside_values(self):
+        """Should only drop the trailing suffix, not '::' occurring inside property values."""
+        decoded = decode_asyncio_agtype_recordset([row(VERTEX)])
+        assert decoded[0]["properties"]["note"] == "a::b"
+
+    def test_decodes_lists_of_annotated_entities(self):
+        """Should strip the per-entity annotations AGE writes inside lists (e.g. `collect(n)`)."""
+        vertices = f"[{VERTEX.replace('gomez', 'wednesday')}, {VERTEX}]"
+        path = f"[{VERTEX}, {EDGE}, {VERTEX}]::path"
+        decoded = decode_asyncio_agtype_recordset([row(vertices), row(path)])
+        assert [v["properties"]["ident"] for v in decoded[0]] == ["wednesday", "gomez"]
+        assert [e["id"] for e in decoded[1]] == [1, 11, 1]
+        assert decoded[0][1]["properties"]["note"] == "a::b"
+
+    def test_decodes_suffixless_values_containing_double_colons(self):
+        """Should parse values without a type suffix unchanged, even when they contain '::'."""
+        decoded = decode_asyncio_agtype_recordset([row('{"note": "a::b"}', '"x::y"', '1.5::numeric')])
+        assert decoded == [{"note": "a::b"}, "x::y", 1.5]
+
+
+class TestAgtypeRecord:
+    def test_from_raw_records(self):
+        """Should build vertex and edge records from raw rows."""
+        vertex, edge = AgtypeRecord.from_raw_records([row(VERTEX, EDGE)])  # type: ignore[arg-type]
+        assert vertex.is_vertex and not vertex.is_edge
+        assert edge.is_edge and edge.type == "edge"
+        assert vertex.properties["ident"] == "gomez"
+
+    def test_json_round_trip(self):
+        """Should serialize to JSON and back to an equal record."""
+        record = AgtypeRecord(label="Human", properties={"ident": "gomez"}, id=1)
+        assert AgtypeRecord.from_json(record.to_json()) == record
+        assert AgtypeRecord.from_json(record.to_json_bytes()) == record
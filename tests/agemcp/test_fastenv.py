@@ -0,0 +1,51 @@
+from pathlib import Path
+
+from agemcp._fastenv import parse
+
+
+class TestFastEnvParse:
+    def test_skips_blank_and_comment_lines(self):
+        """Should ignore blank lines and lines starting with '#'."""
+        assert parse("\n# comment\nA=1\n\n") == {"A": "1"}
+
+    def test_splits_on_first_equals_only(self):
+        """Should keep any '=' after the first as part of the value."""
+        assert parse("DSN=postgresql://u@h/db?a=b") == {"DSN": "postgresql://u@h/db?a=b"}
+
+    def test_unwraps_matching_quotes(self):
+        """Should strip matching single or double quotes around a value."""
+        assert parse("A='one'\nB=\"two\"\nC=three") == {"A": "one", "B": "two", "C": "three"}
+
+    def test_unescapes_escaped_quotes(self):
+        """Should unescape backslash-escaped quotes as written by DotEnvFile.save."""
+        assert parse("A='it\\'s'") == {"A": "it's"}
+
+    def test_strips_inline_comments_from_unquoted_values(self):
+        """Should drop trailing ' # comment' text from unquoted values only."""
+        assert parse("A=1 # one\nB='2 # two'") == {"A": "1", "B": "2 # two"}
+
+    def test_strips_inline_comments_after_quoted_values(self):
+        """Should end a quoted value at its closing quote and ignore a trailing comment."""
+        assert parse('A="x" # note') == {"A": "x"}
+        assert parse("A='it\\'s' # note") == {"A": "it's"}
+
+    def test_parses_lines_after_commented_quoted_value(self):
+        """Should keep parsing the following lines after a quoted value with an inline comment."""
+        assert parse('A="x" # note\nB=2\nC="3"\n') == {"A": "x", "B": "2", "C": "3"}
+
+    def test_unclosed_quote_does_not_swallow_following_lines(self):
+        """Should keep only the opening line for a quote that is never closed, and parse the rest."""
+        assert parse('A="x\nB=2\nC=3') == {"A": "x", "B": "2", "C": "3"}
+
+    def test_multiline_quoted_value(self):
+        """Should join lines of a quoted value until its closing quote."""
+        assert parse("A='{\n  \"x\": 1\n}'\nB=2") == {"A": '{\n  "x": 1\n}', "B": "2"}
+
+    def test_parses_env_example_meta(self):
+        """Should parse the bundled .env.example, including its multi-line _META JSON."""
+        import json
+
+        path = Path(__file__).parents[2] / "src" / "agemcp" / ".env.example"
+        values = parse(path.read_text())
+        assert json.loads(values["_META"])["settings"]
+        assert values["MCP__TRANSPORT"] == "streamable-http"
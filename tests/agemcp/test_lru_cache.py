@@ -0,0 +1,56 @@
+from agemcp.lru_cache import LRUCache
+
+
+class TestLRUCache:
+    def test_get_missing_returns_none(self):
+        """Should return None for keys that were never cached."""
+        assert LRUCache[str, int]().get("missing") is None
+
+    def test_evicts_least_recently_used(self):
+        """Should evict the least recently used key once max_size is exceeded."""
+        cache = LRUCache[str, int](max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1  # "b" is now least recently used
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_put_existing_key_does_not_evict(self):
+        """Should update an existing key in place without evicting another entry."""
+        cache = LRUCache[str, int](max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("a", 10)
+        assert cache.get("a") == 10
+        assert cache.get("b") == 2
+
+    def test_put_existing_none_value_does_not_evict(self):
+        """Should treat a cached None as present when re-inserting its key."""
+        cache = LRUCache[str, int | None](max_size=2)
+        cache.put("a", None)
+        cache.put("b", 2)
+        cache.put("a", 1)
+        assert cache.get("b") == 2
+        assert cache.get("a") == 1
+
+    def test_clear_all(self):
+        """Should drop every entry when no filter is given."""
+        cache = LRUCache[str, int]()
+        cache.put("a", 1)
+        cache.clear()
+        assert cache.get("a") is None
+
+    def test_clear_with_filter(self):
+        """Should only evict the entries matching the filter, keeping recency order."""
+        cache = LRUCache[str, int](max_size=3)
+        for key, value in (("a", 1), ("b", 2), ("c", 3)):
+            cache.put(key, value)
+        cache.clear(filter=lambda item: item[1] % 2 == 1)
+        assert cache.get("a") is None and cache.get("c") is None
+        assert cache.get("b") == 2
+        cache.put("d", 4)
+        cache.put("e", 5)
+        cache.put("f", 6)  # evicts "b", the oldest survivor
+        assert cache.get("b") is None
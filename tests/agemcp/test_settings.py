@@ -0,0 +1,69 @@
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from pydantic import ValidationError
+
+from agemcp.environment import Environment
+from agemcp.settings import AgeSettings, AppSettings, DbSettings, McpSettings, Settings, _build, get_settings
+
+
+class TestGetSettings:
+    def test_returns_cached_instance(self):
+        """Should build the settings once per environment and return the same instance after."""
+        settings = get_settings()
+        assert isinstance(settings, Settings)
+        assert get_settings() is settings
+        assert settings.env == Environment.TESTING
+
+    @pytest.mark.parametrize("env", [Environment.PRODUCTION, Environment.STAGING])
+    def test_unsupported_environments(self, env):
+        """Should raise a ValueError for environments without settings support."""
+        with pytest.raises(ValueError, match="Unsupported environment"):
+            _build(env)
+
+
+@pytest.mark.parametrize("model", [AppSettings, McpSettings, DbSettings, Settings])
+def test_schemas_are_built_at_import(model):
+    """Should have every settings schema fully built at import, so the first get_settings() pays no rebuild."""
+    assert model.__pydantic_complete__
+
+
+class TestMcpSettings:
+    def test_rejects_unknown_choices(self):
+        """Should only accept the known transports and log levels."""
+        with pytest.raises(ValidationError):
+            McpSettings(transport="carrier-pigeon")  # type: ignore[arg-type]
+        with pytest.raises(ValidationError):
+            McpSettings(log_level="VERBOSE")  # type: ignore[arg-type]
+
+    def test_rejects_unknown_keys(self):
+        """Should reject settings keys that are not declared fields."""
+        with pytest.raises(ValidationError):
+            McpSettings(color="blue")  # type: ignore[call-arg]
+
+
+class TestDbSettings:
+    def test_primary_connection_is_built_once(self):
+        """Should reuse the same primary connection settings (and so the same engine) across lookups."""
+        settings = get_settings()
+        assert settings.primary_database() is settings.primary_database()
+        assert settings.primary_database().name == "primary"
+
+    def test_settings_are_frozen(self):
+        """Should reject assignment to loaded settings."""
+        with pytest.raises(ValidationError):
+            get_settings().db.dsn = "postgresql://elsewhere/db"  # type: ignore[misc]
+
+
+class TestAgeSettings:
+    def test_loaded_from_nested_env(self):
+        """Should populate the AGE settings from the AGE__* keys."""
+        age = get_settings().age
+        assert isinstance(age, AgeSettings)
+        assert age.ident_property
+
+    def test_is_frozen(self):
+        """Should reject assignment to the AGE settings."""
+        with pytest.raises(FrozenInstanceError):
+            get_settings().age.ident_property = "other"  # type: ignore[misc]